@@ -1,6 +1,16 @@
-from collections import UserDict
-from typing import Optional, List, Dict, Tuple, Callable
-from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Tuple, Callable, Iterable
+from bisect import bisect_left
+from calendar import isleap
+from datetime import date, timedelta
+from functools import lru_cache
+import sys
+
+
+# Days in a non-leap year preceding the 1st of each month (index = month)
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# Shift from a weekend greeting date to the following Monday (index = weekday)
+_WEEKDAY_SHIFT = (None, None, None, None, None, timedelta(days=2), timedelta(days=1))
 
 
 class PhoneValidationError(Exception):
@@ -32,14 +42,29 @@ class ItemNotFoundError(Exception):
 
 
 class Field:
+    __slots__ = ('value',)
+
     def __init__(self, value: str):
-        self.value = value
+        object.__setattr__(self, 'value', value)
+
+    # Fields are read-only once built, so cached instances are safe to share
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __reduce__(self):
+        # Rebuild through __init__, since slot state can't be set directly
+        return type(self), (self.value,)
 
     def __str__(self) -> str:
         return str(self.value)
 
 
 class Name(Field):
+    __slots__ = ()
+
     def __init__(self, value: str):
         if self.validate(value):
             super().__init__(value)
@@ -52,6 +77,8 @@ class Name(Field):
 
 
 class Phone(Field):
+    __slots__ = ()
+
     def __init__(self, value: str):
         if self.validate(value):
             super().__init__(value)
@@ -60,101 +87,185 @@ class Phone(Field):
 
     @staticmethod
     def validate(value: str) -> bool:
-        return len(value) == 10 and value.isdigit()
+        # isascii() keeps out other Unicode digits that isdigit() accepts
+        return len(value) == 10 and value.isascii() and value.isdigit()
 
 
 class Birthday(Field):
+    __slots__ = ('month', 'day')
+
     def __init__(self, value: str):
-        if self.str_to_datetime(value):
-            super().__init__(value)
-        else:
-            raise BirthdayValidationError()
+        parsed = self.str_to_date(value)
+        super().__init__(value)
+        object.__setattr__(self, 'month', parsed.month)
+        object.__setattr__(self, 'day', parsed.day)
 
     @staticmethod
-    def str_to_datetime(value: str) -> bool:
-        return bool(datetime.strptime(value, "%d.%m.%Y"))
+    def str_to_date(value: str) -> date:
+        # Fixed DD.MM.YYYY layout, so slicing beats strptime's regex machinery
+        if len(value) != 10 or value[2] != '.' or value[5] != '.':
+            raise BirthdayValidationError()
+        day, month, year = value[0:2], value[3:5], value[6:10]
+        # ASCII digits only, like Phone; isdigit() alone lets Unicode digits in
+        if not (value.isascii() and day.isdigit() and month.isdigit()
+                and year.isdigit()):
+            raise BirthdayValidationError()
+        try:
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            raise BirthdayValidationError()
+
+    def day_of_year(self, leap: bool) -> int:
+        # 29.02 lands on day 60, i.e. 01.03, in non-leap years
+        return _DAYS_BEFORE_MONTH[self.month] + self.day + (leap and self.month > 2)
+
+
+# Phone and Birthday are read-only (see Field.__setattr__), so instances can
+# be shared between records and re-validation of repeated values skipped
+@lru_cache(maxsize=4096)
+def _make_phone(value: str) -> Phone:
+    return Phone(value)
+
+
+@lru_cache(maxsize=4096)
+def _make_birthday(value: str) -> Birthday:
+    return Birthday(value)
+
+
+# Bumped by every Record.add_birthday; an AddressBook rebuilds its birthday
+# index when this has moved since the last build
+_birthday_changes = 0
 
 
 class Record:
+    __slots__ = ('name', 'phones', 'birthday')
+
     def __init__(self, name: str):
         self.name = Name(name)
-        self.phones = []
+        self.phones: Dict[str, Phone] = {}
         self.birthday = None
 
     def add_birthday(self, string):
-        self.birthday = Birthday(string)
+        global _birthday_changes
+        self.birthday = _make_birthday(string)
+        _birthday_changes += 1
 
     def add_phone(self, value: str) -> None:
-        self.phones.append(Phone(value))
+        self.phones[value] = _make_phone(value)
 
     def remove_phone(self, value: str) -> None:
-        for phone in self.phones:
-            if phone.value == value:
-                self.phones.remove(phone)
-                return
-        raise ItemNotFoundError(value)
+        if self.phones.pop(value, None) is None:
+            raise ItemNotFoundError(value)
 
     def find_phone(self, value: str) -> Optional[Phone]:
-        matching_phones = [
-            phone for phone in self.phones if phone.value == value]
-        return matching_phones[0] if matching_phones else None
+        return self.phones.get(value)
 
     def edit_phone(self, old_value: str, new_value: str) -> None:
-        if Phone.validate(new_value):
-            self.remove_phone(old_value)
-            self.add_phone(new_value)
-        else:
-            raise PhoneValidationError()
+        phone = _make_phone(new_value)
+        self.remove_phone(old_value)
+        self.phones[new_value] = phone
 
     def __str__(self) -> str:
-        return f"Contact name: {self.name.value}, phones: {
-            '; '.join(p.value for p in self.phones)}"
-
-
-class AddressBook(UserDict):
-    def get_upcoming_birthdays(self) -> List[Dict[str, datetime]]:
-        today = datetime.now()
-        today_plus_seven_days = today + timedelta(days=7)
+        phones = '; '.join(p.value for p in self.phones.values())
+        return f"Contact name: {self.name.value}, phones: {phones}"
+
+
+_MISSING = object()
+
+
+def _bday_code(month: int, day: int) -> int:
+    # Orders birthdays by (month, day) regardless of year
+    return month * 31 + day
+
+
+class AddressBook:
+    def __init__(self, records: Iterable[Record] = ()) -> None:
+        self.data: Dict[str, Record] = {}
+        # (code, name) pairs sorted by birthday, rebuilt lazily by
+        # _birthday_index; a None stamp marks it dirty
+        self._bday_index: List[Tuple[int, str]] = []
+        self._bday_stamp: Optional[int] = None
+        for record in records:
+            self.add_record(record)
+
+    def __reduce__(self):
+        # The index is derived state, so copies and pickles rebuild it
+        return type(self), (list(self.data.values()),)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def _birthday_index(self) -> List[Tuple[int, str]]:
+        if self._bday_stamp != _birthday_changes:
+            self._bday_index = sorted(
+                (_bday_code(record.birthday.month, record.birthday.day), name)
+                for name, record in self.data.items()
+                if record.birthday is not None)
+            self._bday_stamp = _birthday_changes
+        return self._bday_index
+
+    def _birthday_candidates(self, today: date) -> List[Tuple[int, str]]:
+        index = self._birthday_index()
+        start = _bday_code(today.month, today.day)
+        if today.month == 3 and today.day == 1:
+            # 29.02 is greeted on 01.03 in non-leap years
+            start = _bday_code(2, 29)
+        end_date = date.fromordinal(today.toordinal() + 7)
+        end = _bday_code(end_date.month, end_date.day)
+        lo = bisect_left(index, (start,))
+        hi = bisect_left(index, (end + 1,))
+        if start <= end:
+            return index[lo:hi]
+        # The window wraps past 31.12
+        return index[lo:] + index[:hi]
+
+    def get_upcoming_birthdays(self) -> List[Dict[str, str]]:
+        today = date.today()
+        today_ord = today.toordinal()
+        year = today.year
+        # Ordinal of the day before 01.01, so birthdays reduce to int sums
+        this_year_base = date(year, 1, 1).toordinal() - 1
+        next_year_base = date(year + 1, 1, 1).toordinal() - 1
+        this_year_leap = isleap(year)
+        next_year_leap = isleap(year + 1)
         upcoming_birthdays = []
 
-        for record in self.data.values():
-            greeting_date = None  # Initialize greeting_date
-            if record.birthday:
-                birthday_this_year = datetime.strptime(
-                    str(record.birthday), "%d.%m.%Y").replace(year=today.year)
-
-                if today <= birthday_this_year <= today_plus_seven_days:
-                    greeting_date = birthday_this_year
-
-                elif birthday_this_year < today:
-                    birthday_next_year = birthday_this_year.replace(
-                        year=today.year + 1)
-                    if birthday_next_year <= today_plus_seven_days:
-                        greeting_date = birthday_next_year
-
-                if greeting_date and greeting_date.weekday() >= 5:
-                    greeting_date += timedelta(days=(7 -
-                                               greeting_date.weekday()))
-
-                if greeting_date:
-                    upcoming_birthdays.append(
-                        {"name": str(record.name),
-                            "birthday": greeting_date.strftime('%d.%m.%Y')}
-                    )
+        for _, name in self._birthday_candidates(today):
+            record = self.data[name]
+            birthday = record.birthday
+
+            bday_ord = this_year_base + birthday.day_of_year(this_year_leap)
+            if bday_ord < today_ord:
+                bday_ord = next_year_base + \
+                    birthday.day_of_year(next_year_leap)
+            if bday_ord - today_ord > 7:
+                continue
+
+            greeting_date = date.fromordinal(bday_ord)
+            shift = _WEEKDAY_SHIFT[greeting_date.weekday()]
+            if shift:
+                greeting_date += shift
+
+            # Plain f-string formatting skips strftime's format parser
+            greeting_str = f"{greeting_date.day:02d}." \
+                f"{greeting_date.month:02d}.{greeting_date.year:04d}"
+            upcoming_birthdays.append(
+                {"name": str(record.name), "birthday": greeting_str}
+            )
 
         return upcoming_birthdays if upcoming_birthdays else 'There are no upcoming birthdays yet'
 
     def add_record(self, record: Record) -> None:
         self.data[record.name.value] = record
+        self._bday_stamp = None
 
     def find(self, name: str) -> Optional[Record]:
         return self.data.get(name)
 
     def delete(self, name: str) -> None:
-        if name in self.data:
-            del self.data[name]
-        else:
+        if self.data.pop(name, _MISSING) is _MISSING:
             raise ItemNotFoundError(name)
+        self._bday_stamp = None
 
     def __str__(self) -> str:
         return '\n'.join(str(record) for record in self.data.values())
@@ -171,8 +282,6 @@ def input_error(func: Callable) -> Callable:
                 "\tPhone format: all characters in a string are digits, length equal 10"
         except KeyError:
             return "This contact does not exist."
-        except IndexError or TypeError:
-            return "Not enough arguments."
         except PhoneValidationError as e:
             return e
         except NameValidationError as e:
@@ -181,32 +290,46 @@ def input_error(func: Callable) -> Callable:
             return e
         except ItemNotFoundError as e:
             return e
-        except Exception as e:
-            return e
     return inner
 
 
+NOT_ENOUGH_ARGUMENTS = "Not enough arguments."
+
+
 def parse_input(user_input: str) -> Tuple[str, List]:
-    cmd, *args = user_input.split()
-    cmd = cmd.strip().lower()
-    return cmd, args
+    # Split off the command only; the rest is tokenized only when present
+    parts = user_input.split(None, 1)
+    if not parts:
+        return '', []
+    return parts[0].lower(), parts[1].split() if len(parts) > 1 else []
 
 
 @input_error
 def change_contact(args: List[str], book: AddressBook) -> str:
-    name = args[0]
-    old_phone, new_phone = args[1], args[2]
+    n = len(args)
+    if n < 3:
+        return NOT_ENOUGH_ARGUMENTS
+    name, old_phone, new_phone = args[0], args[1], args[2]
+    # Any fourth argument is the new birthday; a malformed one gets the
+    # format error instead of being dropped
+    new_birthday = args[3] if n >= 4 else None
 
     record = book.find(name)
     if record is None:
         return f'Contact {name} not found.'
 
+    if new_birthday:
+        _make_birthday(new_birthday)  # validate before touching the phones
     record.edit_phone(old_phone, new_phone)
+    if new_birthday:
+        record.add_birthday(new_birthday)
     return f'Contact {name} updated successfully.'
 
 
 @input_error
 def add_contact(args, book: AddressBook):
+    if len(args) < 2:
+        return NOT_ENOUGH_ARGUMENTS
     name, phone, = args[0], args[1]
     record = book.find(name)
     if record:
@@ -214,14 +337,15 @@ def add_contact(args, book: AddressBook):
         return "Contact updated."
     else:
         record = Record(name)
-        book.add_record(record)
         record.add_phone(phone)
-        book.add_record(record) 
+        book.add_record(record)
     return "Contact added."
 
 
 @input_error
 def add_birthday(args: List[str], book: AddressBook) -> str:
+    if len(args) < 2:
+        return NOT_ENOUGH_ARGUMENTS
     name, birthday = args[0], args[1]
     record = book.find(name)
     if record is None:
@@ -232,6 +356,8 @@ def add_birthday(args: List[str], book: AddressBook) -> str:
 
 @input_error
 def show_birthday(args: List[str], book: AddressBook) -> str:
+    if not args:
+        return NOT_ENOUGH_ARGUMENTS
     name = args[0]
     record = book.find(name)
     if record is None:
@@ -241,12 +367,14 @@ def show_birthday(args: List[str], book: AddressBook) -> str:
 
 @input_error
 def show_phone(args: List[str], book: AddressBook) -> list:
+    if not args:
+        return NOT_ENOUGH_ARGUMENTS
     name = args[0]
     record = book.find(name)
     if record is None:
         return f'Contact {name} not found.'
     return ', '.join(
-        [str(phone) for phone in record.phones]
+        [str(phone) for phone in record.phones.values()]
     ) if record.phones else 'No phones found.'
 
 
@@ -256,15 +384,14 @@ def show_all(book: AddressBook) -> str:
         return "No contacts."
 
     header = f'{"name":^12}|{"birthday":^12}|{"phones":^12}'
-    rows = []
+    rows = [header]
 
     for name, record in book.data.items():
-        birthday_str = str(record.birthday) if record.birthday else ' '
-        phones_str = ", ".join(str(phone) for phone in record.phones)
-        row = f'{name:^12}|{birthday_str:^12}|{phones_str:^12}'
-        rows.append(row)
+        birthday_str = record.birthday.value if record.birthday else ' '
+        phones_str = ", ".join(record.phones)
+        rows.append(f'{name:^12}|{birthday_str:^12}|{phones_str:^12}')
 
-    return header + '\n' + '\n'.join(rows)
+    return '\n'.join(rows)
 
 
 @input_error
@@ -276,35 +403,82 @@ def birthdays(book: AddressBook):
         return '\n'.join([f"{entry['name']} : {entry['birthday']}" for entry in upcoming_birthdays])
 
 
+EXIT_COMMANDS = ("close", "exit")
+
+COMMANDS: Dict[str, Callable[[List[str], AddressBook], str]] = {
+    "hello": lambda args, book: "How can I help you?",
+    "add": add_contact,
+    "change": change_contact,
+    "phone": show_phone,
+    "all": lambda args, book: show_all(book),
+    "birthdays": lambda args, book: birthdays(book),
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+}
+
+
+def _build_abbreviations(names: List[str],
+                         full_only: Tuple[str, ...] = ()) -> Dict[str, str]:
+    # Maps every unambiguous prefix of a command to its full name. Names in
+    # full_only still make shared prefixes ambiguous but are never shortened
+    abbreviations: Dict[str, str] = {}
+    ambiguous = set()
+    for name in (*names, *full_only):
+        for i in range(1, len(name)):
+            prefix = name[:i]
+            if abbreviations.setdefault(prefix, name) != name:
+                ambiguous.add(prefix)
+    for prefix, name in list(abbreviations.items()):
+        if prefix in ambiguous or name in full_only:
+            del abbreviations[prefix]
+    # A full name wins over being a prefix of a longer one ("add")
+    abbreviations.update((name, name) for name in (*names, *full_only))
+    return abbreviations
+
+
+# A stray "e" must not end the session and lose the unsaved book
+COMMAND_NAMES = _build_abbreviations(list(COMMANDS), EXIT_COMMANDS)
+
+
+# Piped input is answered in batches of this many replies
+BATCH_FLUSH_SIZE = 64
+
+
 def main():
     book = AddressBook()
-    print("Welcome to the assistant bot!")
-    while True:
-        user_input = input("Enter a command: ")
-        command, args = parse_input(user_input)
-
-        match command:
-            case "close" | "exit":
-                print("Good bye!")
+    interactive = sys.stdin.isatty()
+    out_buf: List[str] = ["Welcome to the assistant bot!\n"]
+
+    def flush() -> None:
+        sys.stdout.write(''.join(out_buf))
+        out_buf.clear()
+
+    # Buffered replies must reach stdout even if a command raises
+    try:
+        while True:
+            if interactive:
+                flush()
+                try:
+                    user_input = input("Enter a command: ")
+                except EOFError:
+                    user_input = "close"
+            else:
+                # No prompt when scripted; replies are written in batches
+                if len(out_buf) >= BATCH_FLUSH_SIZE:
+                    flush()
+                user_input = sys.stdin.readline() or "close"
+            command, args = parse_input(user_input)
+            command = COMMAND_NAMES.get(command, command)
+
+            if command in EXIT_COMMANDS:
+                out_buf.append("Good bye!\n")
                 break
-            case "hello":
-                print("How can I help you?")
-            case "add":
-                print(add_contact(args, book))
-            case "change":
-                print(change_contact(args, book))
-            case "phone":
-                print(show_phone(args, book))
-            case "all":
-                print(show_all(book))
-            case "birthdays":
-                print(birthdays(book))
-            case "add-birthday":
-                print(add_birthday(args, book))
-            case "show-birthday":
-                print(show_birthday(args, book))
-            case _:
-                print("Invalid command.")
+
+            handler = COMMANDS.get(command)
+            reply = handler(args, book) if handler else "Invalid command."
+            out_buf.append(f"{reply}\n")
+    finally:
+        flush()
 
 
 # Приклад використання
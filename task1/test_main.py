@@ -0,0 +1,208 @@
+import copy
+import io
+import pickle
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+import main
+
+
+TODAY = date(2026, 10, 14)  # Wednesday
+
+
+def fixed_today(today: date):
+    class FixedDate(date):
+        @classmethod
+        def today(cls):
+            return cls(today.year, today.month, today.day)
+
+    return mock.patch.object(main, "date", FixedDate)
+
+
+def make_record(name: str, birthday: str = None) -> main.Record:
+    record = main.Record(name)
+    if birthday:
+        record.add_birthday(birthday)
+    return record
+
+
+class FieldTest(unittest.TestCase):
+    def test_cached_fields_are_read_only(self):
+        birthday = main._make_birthday("16.10.1990")
+        phone = main._make_phone("1234567890")
+        with self.assertRaises(AttributeError):
+            birthday.value = "01.01.1990"
+        with self.assertRaises(AttributeError):
+            birthday.month = 1
+        with self.assertRaises(AttributeError):
+            phone.value = "5555555555"
+        self.assertEqual((birthday.value, birthday.month, birthday.day),
+                         ("16.10.1990", 10, 16))
+
+
+def upcoming(book: main.AddressBook, today: date = TODAY) -> list:
+    with fixed_today(today):
+        result = book.get_upcoming_birthdays()
+    return [] if isinstance(result, str) else result
+
+
+def upcoming_names(book: main.AddressBook, today: date = TODAY) -> list:
+    return [entry["name"] for entry in upcoming(book, today)]
+
+
+def scan_upcoming(book: main.AddressBook, today: date) -> list:
+    # Straightforward reference: check every record against the window
+    result = []
+    for name, record in book.data.items():
+        if record.birthday is None:
+            continue
+        for year in (today.year, today.year + 1):
+            try:
+                greeting = date(year, record.birthday.month, record.birthday.day)
+            except ValueError:
+                greeting = date(year, 3, 1)
+            if greeting >= today:
+                break
+        if (greeting - today).days <= 7:
+            if greeting.weekday() >= 5:
+                greeting += timedelta(days=7 - greeting.weekday())
+            result.append({"name": name,
+                           "birthday": greeting.strftime("%d.%m.%Y")})
+    return result
+
+
+def by_name(entries: list) -> list:
+    return sorted(entries, key=lambda entry: entry["name"])
+
+
+class UpcomingBirthdaysTest(unittest.TestCase):
+    def test_birthday_set_after_add_record(self):
+        book = main.AddressBook()
+        record = make_record("John")
+        book.add_record(record)
+        self.assertEqual(upcoming_names(book), [])
+        record.add_birthday("16.10.1990")
+        self.assertEqual(upcoming_names(book), ["John"])
+
+    def test_birthday_changed_after_add_record(self):
+        book = main.AddressBook()
+        record = make_record("John", "16.10.1990")
+        book.add_record(record)
+        self.assertEqual(upcoming_names(book), ["John"])
+        record.add_birthday("01.01.1990")
+        self.assertEqual(upcoming_names(book), [])
+
+    def test_delete_and_replace(self):
+        book = main.AddressBook()
+        book.add_record(make_record("John", "16.10.1990"))
+        book.delete("John")
+        self.assertEqual(upcoming_names(book), [])
+        book.add_record(make_record("John", "17.10.1990"))
+        book.add_record(make_record("John"))
+        self.assertEqual(upcoming_names(book), [])
+
+    def test_record_shared_by_two_books(self):
+        first, second = main.AddressBook(), main.AddressBook()
+        record = make_record("John")
+        first.add_record(record)
+        second.add_record(record)
+        record.add_birthday("16.10.1990")
+        self.assertEqual(upcoming_names(first), ["John"])
+        self.assertEqual(upcoming_names(second), ["John"])
+
+    def test_copy_is_independent(self):
+        book = main.AddressBook([make_record("John", "16.10.1990")])
+        self.assertEqual(upcoming_names(book), ["John"])
+        clone = copy.copy(book)
+        clone.add_record(make_record("Ann", "15.10.1990"))
+        book.delete("John")
+        self.assertEqual(upcoming_names(book), [])
+        self.assertEqual(upcoming_names(clone), ["Ann", "John"])
+
+    def test_deepcopy_and_pickle(self):
+        book = main.AddressBook([make_record("John", "16.10.1990"),
+                                 make_record("Ann", "01.01.1990")])
+        for restored in (copy.deepcopy(book),
+                         pickle.loads(pickle.dumps(book))):
+            self.assertIsNot(restored.find("John"), book.find("John"))
+            self.assertEqual(upcoming(restored), upcoming(book))
+            restored.find("Ann").add_birthday("17.10.1990")
+            self.assertEqual(upcoming_names(restored), ["John", "Ann"])
+            self.assertEqual(upcoming_names(book), ["John"])
+            restored.find("Ann").add_birthday("01.01.1990")
+
+    def test_window_wraps_past_new_year(self):
+        book = main.AddressBook([make_record("Ann", "02.01.1990"),
+                                 make_record("John", "29.12.1990"),
+                                 make_record("Bob", "27.12.1990")])
+        self.assertEqual(upcoming(book, date(2026, 12, 28)), [
+            {"name": "John", "birthday": "29.12.2026"},
+            {"name": "Ann", "birthday": "04.01.2027"},
+        ])
+
+    def test_leap_day_greeted_on_first_of_march(self):
+        book = main.AddressBook([make_record("Ann", "29.02.2000")])
+        self.assertEqual(upcoming(book, date(2027, 3, 1)), [
+            {"name": "Ann", "birthday": "01.03.2027"},
+        ])
+
+    def test_matches_full_scan_every_day(self):
+        book = main.AddressBook()
+        for i in range(0, 366, 3):
+            birthday = date(2000, 1, 1) + timedelta(days=i)
+            book.add_record(make_record(f"n{i}", birthday.strftime("%d.%m.%Y")))
+        book.add_record(make_record("leap", "29.02.1996"))
+        book.add_record(make_record("none"))
+        for i in range(0, 366, 15):
+            book.delete(f"n{i}")
+        for i in range(1, 366, 11):
+            record = book.find(f"n{i}")
+            if record is not None:
+                record.add_birthday("20.06.1990")
+
+        for year in (2026, 2028):
+            day = date(year, 1, 1)
+            while day.year == year:
+                self.assertEqual(by_name(upcoming(book, day)),
+                                 by_name(scan_upcoming(book, day)), day)
+                day += timedelta(days=1)
+
+
+class CommandAbbreviationTest(unittest.TestCase):
+    def test_unambiguous_prefixes(self):
+        names = main.COMMAND_NAMES
+        self.assertEqual(names["ch"], "change")
+        self.assertEqual(names["add-"], "add-birthday")
+        self.assertEqual(names["s"], "show-birthday")
+        self.assertEqual(names["add"], "add")
+        for prefix in ("a", "ad", "c"):
+            self.assertNotIn(prefix, names)
+
+    def test_exit_commands_are_never_abbreviated(self):
+        names = main.COMMAND_NAMES
+        for prefix in ("e", "ex", "exi", "cl", "clo", "clos"):
+            self.assertNotIn(prefix, names)
+        self.assertEqual(names["exit"], "exit")
+        self.assertEqual(names["close"], "close")
+
+    def test_build_abbreviations(self):
+        self.assertEqual(
+            main._build_abbreviations(["ab", "abc"], ("x",)),
+            {"ab": "ab", "abc": "abc", "x": "x"})
+
+    def test_stray_prefix_does_not_exit(self):
+        stdin = io.StringIO("e\nadd John 1234567890\nexit\n")
+        stdout = io.StringIO()
+        with mock.patch("sys.stdin", stdin), mock.patch("sys.stdout", stdout):
+            main.main()
+        self.assertEqual(stdout.getvalue().splitlines(), [
+            "Welcome to the assistant bot!",
+            "Invalid command.",
+            "Contact added.",
+            "Good bye!",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()